@@ -16,6 +16,7 @@
 
 """Abstract base classes."""
 import logging
+import sys
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -64,7 +65,9 @@ class _XMLObject:
         name_spaces = name_spaces or {}
         self.name_spaces = {**config.NAME_SPACES, **name_spaces}
         self.ns: str = (
-            self.name_spaces.get(self._default_nsid, "") if ns is None else ns
+            self.name_spaces.get(self._default_nsid, "")
+            if ns is None
+            else sys.intern(ns)
         )
         for arg in kwargs:
             setattr(self, arg, kwargs[arg])
@@ -144,7 +147,44 @@ class _XMLObject:
         element: Element = config.etree.Element(
             f"{self.ns}{self.get_tag_name()}",
         )
+        self.populate_element(
+            element,
+            precision=precision,
+            verbosity=verbosity,
+        )
+        return element
+
+    def populate_element(
+        self,
+        element: Element,
+        precision: Optional[int] = None,
+        verbosity: Verbosity = Verbosity.normal,
+    ) -> None:
+        """
+        Add the attributes and children of the KML Object to an existing Element.
+
+        The element is populated in place, which allows child objects to be
+        serialized directly into a ``SubElement`` of their parent, instead of
+        building a detached element that has to be appended afterwards.
+        The registered setters are not called for attributes that are ``None``,
+        unless the verbosity is ``Verbosity.verbose``.
+
+        Parameters
+        ----------
+        element : Element
+            The element to populate.
+        precision : Optional[int], default=None
+            The precision of the KML object.
+        verbosity : Verbosity, default=Verbosity.normal
+            The verbosity level.
+
+        """
+        # Only verbose output writes defaults for unset attributes, skip the
+        # setter call for them otherwise.
+        skip_unset = verbosity is not Verbosity.verbose
         for item in registry.get(self.__class__):
+            if skip_unset and getattr(self, item.attr_name, None) is None:
+                continue
             item.set_element(
                 obj=self,
                 element=element,
@@ -154,7 +194,6 @@ class _XMLObject:
                 verbosity=verbosity,
                 default=item.default,
             )
-        return element
 
     def to_string(
         self,
@@ -288,6 +327,9 @@ class _XMLObject:
         name_spaces = name_spaces or {}
         name_spaces = {**config.NAME_SPACES, **name_spaces}
         kwargs: Dict[str, Any] = {"ns": ns, "name_spaces": name_spaces}
+        if not (len(element) or element.text or element.keys()):
+            # Nothing to parse, every get_kwarg helper would come up empty.
+            return kwargs
         for item in registry.get(cls):
             for name_space in item.ns_ids:
                 kwarg = item.get_kwarg(
@@ -310,23 +352,26 @@ class _XMLObject:
     def class_from_element(
         cls,
         *,
-        ns: str,
+        ns: Optional[str] = None,
         name_spaces: Optional[Dict[str, str]] = None,
         element: Element,
-        strict: bool,
+        strict: bool = True,
     ) -> Self:
         """
         Create an XML object from an etree element.
 
+        An already parsed element, e.g. an lxml subtree, can be passed in
+        directly without serializing and re-parsing it with ``from_string``.
+
         Parameters
         ----------
-        ns : str
-            The namespace.
+        ns : Optional[str], default=None
+            The namespace, defaults to the namespace of the class.
         name_spaces : Optional[Dict[str, str]], default=None
             The dictionary of namespace prefixes and URIs.
         element : Element
             The XML element.
-        strict : bool
+        strict : bool, default=True
             Whether to enforce strict parsing.
 
         Returns
@@ -335,6 +380,11 @@ class _XMLObject:
             The XML object.
 
         """
+        if ns is None:
+            ns = cls._get_ns(
+                ns,
+                name_spaces={**config.NAME_SPACES, **(name_spaces or {})},
+            )
         kwargs = cls._get_kwargs(
             ns=ns,
             name_spaces=name_spaces,
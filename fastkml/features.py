@@ -98,7 +98,7 @@ class Snippet(_XMLObject):
     """
 
     text: Optional[str]
-    max_lines: Optional[int] = None
+    max_lines: Optional[int]
 
     def __init__(
         self,
@@ -27,6 +27,7 @@ elements.
 
 import logging
 import re
+from itertools import repeat
 from typing import Any
 from typing import Dict
 from typing import Final
@@ -93,6 +94,8 @@ AnyGeometryType = Union[GeometryType, MultiGeometryType]
 
 MsgMutualExclusive: Final = "Geometry and kml coordinates are mutually exclusive"
 
+_comma_spaces: Final = re.compile(r", +")
+
 xml_attrs = {"ns", "name_spaces", "id", "target_id"}
 
 
@@ -166,9 +169,11 @@ def coordinates_subelement(
             msg = f"Invalid dimensions in coordinates '{coords}'"
             raise KMLWriteError(msg)
         if precision is None:
-            tuples = (",".join(str(c) for c in coord) for coord in coords)
+            tuples = (",".join(map(str, coord)) for coord in coords)
         else:
-            tuples = (",".join(f"{c:.{precision}f}" for c in coord) for coord in coords)
+            # Build the format string once instead of once for every value.
+            fmt = f"{{:.{precision}f}}".format
+            tuples = (",".join(map(fmt, coord)) for coord in coords)
         element.text = " ".join(tuples)
 
 
@@ -205,13 +210,19 @@ def subelement_coordinates_kwarg(
 
     """
     try:
-        latlons = re.sub(r", +", ",", element.text.strip()).split()
+        latlons = _comma_spaces.sub(",", element.text.strip()).split()
     except AttributeError:
         return {}
     try:
+        dimensions = set(map(str.count, latlons, repeat(",")))
+        if len(dimensions) == 1:
+            # All tuples have the same dimension: convert every value in one
+            # pass and regroup, instead of building a generator per tuple.
+            values = map(float, ",".join(latlons).split(","))
+            return {kwarg: list(zip(*[values] * (dimensions.pop() + 1)))}
         return {
             kwarg: [  # type: ignore[dict-item]
-                tuple(float(c) for c in latlon.split(",")) for latlon in latlons
+                tuple(map(float, latlon.split(","))) for latlon in latlons
             ],
         }
     except ValueError as error:
@@ -1331,35 +1342,25 @@ def create_kml_geometry(
         KML geometry object.
 
     """
-    _map_to_kml = {
-        geo.Point: Point,
-        geo.Polygon: Polygon,
-        geo.LinearRing: LinearRing,
-        geo.LineString: LineString,
-        geo.MultiPoint: MultiGeometry,
-        geo.MultiLineString: MultiGeometry,
-        geo.MultiPolygon: MultiGeometry,
-        geo.GeometryCollection: MultiGeometry,
-    }
     geom = shape(geometry)
-    for geometry_class, kml_class in _map_to_kml.items():
-        if isinstance(geom, geometry_class):
-            return cast(
-                _Geometry,
-                kml_class(
-                    ns=ns,
-                    name_spaces=name_spaces,
-                    id=id,
-                    target_id=target_id,
-                    extrude=extrude,
-                    tessellate=tessellate,
-                    altitude_mode=altitude_mode,
-                    geometry=geom,
-                ),
-            )
-    # this should be unreachable, but mypy doesn't know that
-    msg = f"Unsupported geometry type {type(geometry)}"  # pragma: no cover
-    raise KMLWriteError(msg)  # pragma: no cover
+    kml_class = _map_to_kml.get(type(geom))
+    if kml_class is None:  # pragma: no cover
+        # shape() always returns one of the mapped pygeoif classes
+        msg = f"Unsupported geometry type {type(geometry)}"
+        raise KMLWriteError(msg)
+    return cast(
+        _Geometry,
+        kml_class(
+            ns=ns,
+            name_spaces=name_spaces,
+            id=id,
+            target_id=target_id,
+            extrude=extrude,
+            tessellate=tessellate,
+            altitude_mode=altitude_mode,
+            geometry=geom,
+        ),
+    )
 
 
 class MultiGeometry(_BaseObject):
@@ -1489,3 +1490,14 @@ registry.register(
         set_element=xml_subelement_list,
     ),
 )
+
+_map_to_kml = {
+    geo.Point: Point,
+    geo.Polygon: Polygon,
+    geo.LinearRing: LinearRing,
+    geo.LineString: LineString,
+    geo.MultiPoint: MultiGeometry,
+    geo.MultiLineString: MultiGeometry,
+    geo.MultiPolygon: MultiGeometry,
+    geo.GeometryCollection: MultiGeometry,
+}
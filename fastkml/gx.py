@@ -87,6 +87,7 @@ from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import arrow
 import pygeoif.geometry as geo
@@ -163,30 +164,56 @@ class TrackItem:
         """
         name_spaces = name_spaces or {}
         name_spaces = {**config.NAME_SPACES, **name_spaces}
-        element: Element = config.etree.Element(
-            f"{name_spaces.get('kml', '')}when",
-        )
-        if self.when:
-            element.text = self.when.isoformat()
-        yield element
-        element = config.etree.Element(
-            f"{name_spaces.get('gx', '')}coord",
+        for tag, text in zip(
+            _track_item_tags(name_spaces),
+            _track_item_texts(self),
+        ):
+            element: Element = config.etree.Element(tag)
+            if text:
+                element.text = text
+            yield element
+
+
+def _track_item_tags(name_spaces: Dict[str, str]) -> Tuple[str, str, str]:
+    """
+    Get the qualified tag names of the gx:when, gx:coord and gx:angles elements.
+
+    The tags are the same for all items of a track, compute them once per track
+    instead of once per track item.
+    """
+    return (
+        f"{name_spaces.get('kml', '')}when",
+        f"{name_spaces.get('gx', '')}coord",
+        f"{name_spaces.get('gx', '')}angles",
+    )
+
+
+def _track_item_texts(
+    track_item: TrackItem,
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Get the text of the gx:when, gx:coord and gx:angles elements of a track item."""
+    when = track_item.when.isoformat() if track_item.when else None
+    coord = (
+        " ".join(
+            [
+                str(c) for c in track_item.coord.coords[0]  # type:ignore[misc]
+            ],
         )
-        if self.coord:
-            element.text = " ".join(
-                [
-                    str(c) for c in self.coord.coords[0]  # type:ignore[misc]
-                ],
-            )
-        yield element
-        element = config.etree.Element(
-            f"{name_spaces.get('gx', '')}angles",
+        if track_item.coord
+        else None
+    )
+    angles = (
+        " ".join(
+            [
+                str(track_item.angle.heading),
+                str(track_item.angle.tilt),
+                str(track_item.angle.roll),
+            ],
         )
-        if self.angle:
-            element.text = " ".join(
-                [str(self.angle.heading), str(self.angle.tilt), str(self.angle.roll)],
-            )
-        yield element
+        if track_item.angle
+        else None
+    )
+    return when, coord, angles
 
 
 def track_items_to_geometry(track_items: Iterable[TrackItem]) -> geo.LineString:
@@ -370,16 +397,47 @@ class Track(_Geometry):
             The ElementTree element representation of the track.
 
         """
-        element = super().etree_element(precision=precision, verbosity=verbosity)
+        element: Element = config.etree.Element(
+            f"{self.ns}{self.get_tag_name()}",
+        )
+        self.populate_element(
+            element,
+            precision=precision,
+            verbosity=verbosity,
+            name_spaces=name_spaces,
+        )
+        return element
+
+    def populate_element(
+        self,
+        element: Element,
+        precision: Optional[int] = None,
+        verbosity: Verbosity = Verbosity.normal,
+        name_spaces: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Populate the ElementTree element with the track.
+
+        Parameters
+        ----------
+        element : Element
+            The element to populate.
+        precision : Optional[int], optional
+            The precision for floating-point values, by default None
+        verbosity : Verbosity, optional
+            The verbosity level for the element, by default Verbosity.normal
+        name_spaces : Optional[Dict[str, str]], optional
+            A dictionary of namespace prefixes and URIs for the track items,
+            by default None
+
+        """
+        super().populate_element(element, precision=precision, verbosity=verbosity)
         if self.track_items:
+            tags = _track_item_tags({**config.NAME_SPACES, **(name_spaces or {})})
             for track_item in self.track_items:
-                for track_item_element in track_item.etree_elements(
-                    precision=precision,
-                    verbosity=verbosity,
-                    name_spaces=name_spaces,
-                ):
-                    element.append(track_item_element)
-        return element
+                for tag, text in zip(tags, _track_item_texts(track_item)):
+                    subelement = config.etree.SubElement(element, tag)
+                    subelement.text = text
 
     @classmethod
     def _get_timestamps(cls, element: Element) -> List[Optional[datetime.datetime]]:
@@ -425,7 +483,7 @@ class Track(_Geometry):
         for coord in element.findall(f"{config.GXNS}coord"):
             if coord is not None and coord.text:
                 coords.append(
-                    geo.Point(*[float(c) for c in coord.text.strip().split()]),
+                    geo.Point(*map(float, coord.text.strip().split())),
                 )
             else:
                 coords.append(None)
@@ -450,7 +508,7 @@ class Track(_Geometry):
         angles: List[Optional[Angle]] = []
         for angle in element.findall(f"{config.GXNS}angles"):
             if angle is not None and angle.text:
-                angles.append(Angle(*[float(a) for a in angle.text.strip().split()]))
+                angles.append(Angle(*map(float, angle.text.strip().split())))
             else:
                 angles.append(None)
         return angles
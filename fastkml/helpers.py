@@ -33,6 +33,9 @@ from fastkml.types import Element
 
 logger = logging.getLogger(__name__)
 
+# Exact matches only, so relaxed matches still go through the enum and get logged.
+_enum_values: Dict[Tuple[Type[Enum], str], Enum] = {}
+
 
 def handle_error(
     *,
@@ -80,6 +83,29 @@ def handle_error(
     logger.warning("%s, %s", error, msg)
 
 
+def _find_subelement(element: Element, tag: str) -> Optional[Element]:
+    """
+    Return the first direct child of the element with the given tag.
+
+    lxml's ``find`` goes through its Python ElementPath implementation, while
+    ``iterchildren`` filters the children by tag in C. The stdlib ``find``
+    already handles plain tags in C.
+
+    Args:
+    ----
+        element (Element): The parent element.
+        tag (str): The namespaced tag of the child to find.
+
+    Returns:
+    -------
+        Optional[Element]: The first matching child, or None if there is none.
+
+    """
+    if hasattr(element, "iterchildren"):
+        return next(element.iterchildren(tag), None)
+    return element.find(tag)
+
+
 def get_value(
     obj: _XMLObject,
     *,
@@ -104,9 +130,11 @@ def get_value(
 
     """
     value = getattr(obj, attr_name, None)
-    if value is None and default is not None and verbosity == Verbosity.verbose:
-        return default
-    return None if value == default and verbosity == Verbosity.terse else value
+    if verbosity is Verbosity.normal:
+        return value
+    if verbosity is Verbosity.verbose:
+        return default if value is None else value
+    return None if value == default else value
 
 
 def node_text(
@@ -266,7 +294,7 @@ def bool_subelement(
             element,
             f"{obj.ns}{node_name}",
         )
-        subelement.text = str(int(value))
+        subelement.text = "1" if value else "0"
 
 
 def int_subelement(
@@ -439,12 +467,15 @@ def xml_subelement(
         None
 
     """
-    if getattr(obj, attr_name, None):
-        element.append(
-            getattr(obj, attr_name).etree_element(
-                precision=precision,
-                verbosity=verbosity,
-            ),
+    if value := getattr(obj, attr_name, None):
+        subelement = config.etree.SubElement(
+            element,
+            f"{value.ns}{value.get_tag_name()}",
+        )
+        value.populate_element(
+            subelement,
+            precision=precision,
+            verbosity=verbosity,
         )
 
 
@@ -476,11 +507,17 @@ def xml_subelement_list(
         None
 
     """
-    if getattr(obj, attr_name, None):
-        for item in getattr(obj, attr_name):
+    if items := getattr(obj, attr_name, None):
+        for item in items:
             if item:
-                element.append(
-                    item.etree_element(precision=precision, verbosity=verbosity),
+                subelement = config.etree.SubElement(
+                    element,
+                    f"{item.ns}{item.get_tag_name()}",
+                )
+                item.populate_element(
+                    subelement,
+                    precision=precision,
+                    verbosity=verbosity,
                 )
 
 
@@ -514,9 +551,8 @@ def node_text_kwarg(
             corresponding text content, if it exists.
 
     """
-    return (
-        {kwarg: element.text.strip()} if element.text and element.text.strip() else {}
-    )
+    node_text = element.text.strip() if element.text else ""
+    return {kwarg: node_text} if node_text else {}
 
 
 def subelement_text_kwarg(
@@ -548,10 +584,11 @@ def subelement_text_kwarg(
             with the specified key.
 
     """
-    node = element.find(f"{ns}{node_name}")
+    node = _find_subelement(element, f"{ns}{node_name}")
     if node is None:
         return {}
-    return {kwarg: node.text.strip()} if node.text and node.text.strip() else {}
+    node_text = node.text.strip() if node.text else ""
+    return {kwarg: node_text} if node_text else {}
 
 
 def attribute_text_kwarg(
@@ -633,12 +670,13 @@ def subelement_bool_kwarg(
     """
     assert len(classes) == 1  # noqa: S101
     assert issubclass(classes[0], bool)  # noqa: S101
-    node = element.find(f"{ns}{node_name}")
+    node = _find_subelement(element, f"{ns}{node_name}")
     if node is None:
         return {}
-    if node.text and node.text.strip():
+    node_text = node.text.strip() if node.text else ""
+    if node_text:
         try:
-            return {kwarg: _get_boolean_value(text=node.text.strip(), strict=strict)}
+            return {kwarg: _get_boolean_value(text=node_text, strict=strict)}
         except ValueError as exc:
             handle_error(
                 error=exc,
@@ -682,12 +720,13 @@ def subelement_int_kwarg(
         ValueError: If the value of the subelement is not a valid integer and strict.
 
     """
-    node = element.find(f"{ns}{node_name}")
+    node = _find_subelement(element, f"{ns}{node_name}")
     if node is None:
         return {}
-    if node.text and node.text.strip():
+    node_text = node.text.strip() if node.text else ""
+    if node_text:
         try:
-            return {kwarg: int(node.text.strip())}
+            return {kwarg: int(node_text)}
         except ValueError as exc:
             handle_error(
                 error=exc,
@@ -763,12 +802,13 @@ def subelement_float_kwarg(
         ValueError: If the value of the subelement cannot be converted and strict.
 
     """
-    node = element.find(f"{ns}{node_name}")
+    node = _find_subelement(element, f"{ns}{node_name}")
     if node is None:
         return {}
-    if node.text and node.text.strip():
+    node_text = node.text.strip() if node.text else ""
+    if node_text:
         try:
-            return {kwarg: float(node.text.strip())}
+            return {kwarg: float(node_text)}
         except ValueError as exc:
             handle_error(
                 error=exc,
@@ -827,8 +867,13 @@ def attribute_float_kwarg(
 
 
 def _get_enum_value(*, enum_class: Type[Enum], text: str, strict: bool) -> Enum:
+    value = _enum_values.get((enum_class, text))
+    if value is not None:
+        return value
     value = enum_class(text)
-    if strict and value.value != text:
+    if value.value == text:
+        _enum_values[(enum_class, text)] = value
+    elif strict:
         msg = f"Value {text} is not a valid value for Enum {enum_class.__name__}"
         raise ValueError(msg)
     return value
@@ -868,7 +913,7 @@ def subelement_enum_kwarg(
     """
     assert len(classes) == 1  # noqa: S101
     assert issubclass(classes[0], Enum)  # noqa: S101
-    node = element.find(f"{ns}{node_name}")
+    node = _find_subelement(element, f"{ns}{node_name}")
     if node is None:
         return {}
     node_text = node.text.strip() if node.text else ""
@@ -973,7 +1018,7 @@ def xml_subelement_kwarg(
     """
     for cls in classes:
         assert issubclass(cls, _XMLObject)  # noqa: S101
-        subelement = element.find(f"{ns}{cls.get_tag_name()}")
+        subelement = _find_subelement(element, f"{ns}{cls.get_tag_name()}")
         if subelement is not None:
             return {
                 kwarg: cls.class_from_element(
@@ -1015,21 +1060,30 @@ def xml_subelement_list_kwarg(
             argument and its list of subelements.
 
     """
-    args_list = []
-    assert node_name is not None  # noqa: S101
-    assert name_spaces is not None  # noqa: S101
+    subelements: Dict[str, List[Element]] = {}
+    class_subelements: List[Tuple[Type[_XMLObject], List[Element]]] = []
     for obj_class in classes:
         assert issubclass(obj_class, _XMLObject)  # noqa: S101
-        if subelements := element.findall(f"{ns}{obj_class.get_tag_name()}"):
-            args_list.extend(
-                [
-                    obj_class.class_from_element(
-                        ns=ns,
-                        name_spaces=name_spaces,
-                        element=subelement,
-                        strict=strict,
-                    )
-                    for subelement in subelements
-                ],
+        tag_subelements = subelements.setdefault(f"{ns}{obj_class.get_tag_name()}", [])
+        class_subelements.append((obj_class, tag_subelements))
+    if not subelements:
+        return {kwarg: []}
+    if hasattr(element, "iterchildren"):
+        # lxml filters the children by all tags in a single pass.
+        for subelement in element.iterchildren(*subelements):
+            subelements[subelement.tag].append(subelement)
+    else:
+        for tag, tag_subelements in subelements.items():
+            tag_subelements.extend(element.findall(tag))
+    return {
+        kwarg: [
+            obj_class.class_from_element(
+                ns=ns,
+                name_spaces=name_spaces,
+                element=subelement,
+                strict=strict,
             )
-    return {kwarg: args_list}
+            for obj_class, tag_subelements in class_subelements
+            for subelement in tag_subelements
+        ],
+    }
@@ -32,8 +32,11 @@ from typing import Any
 from typing import AnyStr
 from typing import Dict
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Type
 from typing import Union
 from typing import cast
 
@@ -57,6 +60,39 @@ logger = logging.getLogger(__name__)
 
 kml_children = Union[Folder, Document, Placemark, GroundOverlay, PhotoOverlay]
 
+_CHUNK_SIZE = 32768
+
+
+def _iterparse(file: Union[Path, str, IO[AnyStr]]) -> Iterator[Tuple[str, Element]]:
+    """
+    Yield the start and end events of an XML file.
+
+    With lxml the file is fed in chunks to an ``XMLPullParser`` with the same
+    lenient options ``KML.parse`` uses. Unlike ``lxml.etree.iterparse`` this
+    also accepts text streams. Other backends use their own ``iterparse``.
+    """
+    try:
+        parser = config.etree.XMLPullParser(
+            events=("start", "end"),
+            huge_tree=True,
+            recover=True,
+        )
+    except TypeError:
+        yield from config.etree.iterparse(file, events=("start", "end"))
+        return
+    if isinstance(file, (str, Path)):
+        with Path(file).open("rb") as stream:
+            yield from _iterparse(stream)
+        return
+    while True:
+        chunk = file.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
 
 class KML(_XMLObject):
     """represents a KML File."""
@@ -120,6 +156,118 @@ class KML(_XMLObject):
             Element: The etree Element object representing the KML element.
 
         """
+        root = self._root_element()
+        xml_subelement_list(
+            obj=self,
+            element=root,
+            attr_name="features",
+            node_name="",
+            precision=precision,
+            verbosity=verbosity,
+            default=None,
+        )
+        return root
+
+    def write(
+        self,
+        file: Union[Path, str, IO[bytes]],
+        *,
+        prettyprint: bool = True,
+        precision: Optional[int] = None,
+        verbosity: Verbosity = Verbosity.normal,
+    ) -> None:
+        """
+        Write the KML document with an XML declaration to a file.
+
+        With lxml the document is written incrementally, one feature at a time,
+        so only the element tree of the feature being written is kept in memory.
+        The output is the same as ``to_string`` after the XML declaration.
+        The standard library builds the whole tree before writing it.
+
+        Args:
+        ----
+            file: The file to write to.
+                Can be a file path (str or Path), or a binary file-like object.
+
+        Keyword Args:
+        ------------
+            prettyprint (bool): Whether to pretty print the XML (lxml only).
+            precision (Optional[int]): The precision used for floating-point values.
+            verbosity (Verbosity): The verbosity level for generating the KML element.
+
+        """
+        if not hasattr(config.etree, "LXML_VERSION"):
+            config.etree.ElementTree(
+                self.etree_element(precision=precision, verbosity=verbosity),
+            ).write(file, encoding="UTF-8", xml_declaration=True)
+            return
+        if isinstance(file, (str, Path)):
+            with Path(file).open("wb") as stream:
+                self._write_features(
+                    stream,
+                    prettyprint=prettyprint,
+                    precision=precision,
+                    verbosity=verbosity,
+                )
+            return
+        self._write_features(
+            file,
+            prettyprint=prettyprint,
+            precision=precision,
+            verbosity=verbosity,
+        )
+
+    def _write_features(
+        self,
+        file: IO[bytes],
+        *,
+        prettyprint: bool,
+        precision: Optional[int],
+        verbosity: Verbosity,
+    ) -> None:
+        """Write the document to a binary file one top-level feature at a time."""
+        root = self._root_element()
+        file.write(b"<?xml version='1.0' encoding='UTF-8'?>\n")
+        tail = b""
+        for feature in self.features:
+            if not feature:
+                continue
+            element = config.etree.SubElement(
+                root,
+                f"{feature.ns}{feature.get_tag_name()}",
+            )
+            feature.populate_element(
+                element,
+                precision=precision,
+                verbosity=verbosity,
+            )
+            # Serialize the feature as the only child of the root, so the kml
+            # namespace is declared once on the root, like in to_string.
+            xml = config.etree.tostring(
+                root,
+                encoding="UTF-8",
+                pretty_print=prettyprint,
+            )
+            root.remove(element)
+            head_end = xml.index(b">") + 1
+            tail_start = xml.rindex(b"</")
+            body = xml[head_end:tail_start]
+            feature_end = len(body.rstrip())
+            if not tail:
+                file.write(xml[:head_end])
+            file.write(body[:feature_end])
+            tail = body[feature_end:] + xml[tail_start:]
+        file.write(
+            tail
+            or config.etree.tostring(
+                root,
+                encoding="UTF-8",
+                pretty_print=prettyprint,
+            ),
+        )
+
+    def _root_element(self) -> Element:
+        """Return the kml root element without any features."""
         # self.ns may be empty, which leads to unprefixed kml elements.
         # However, in this case the xlmns should still be mentioned on the kml
         # element, just without prefix.
@@ -137,15 +285,6 @@ class KML(_XMLObject):
             root = config.etree.Element(
                 f"{self.ns}{self.get_tag_name()}",
             )
-        xml_subelement_list(
-            obj=self,
-            element=root,
-            attr_name="features",
-            node_name="",
-            precision=precision,
-            verbosity=verbosity,
-            default=None,
-        )
         return cast(Element, root)
 
     def append(
@@ -208,6 +347,73 @@ class KML(_XMLObject):
             element=root,
         )
 
+    @classmethod
+    def iter_features(
+        cls,
+        file: Union[Path, str, IO[AnyStr]],
+        *,
+        ns: Optional[str] = None,
+        name_spaces: Optional[Dict[str, str]] = None,
+        strict: bool = True,
+    ) -> Iterator[Union[Placemark, GroundOverlay, PhotoOverlay]]:
+        """
+        Iterate over the placemarks and overlays of a KML file.
+
+        The file is parsed incrementally. Each feature is yielded as soon as its
+        closing tag has been read and is then removed from the partially built
+        tree, so memory use stays bounded by the largest single feature instead
+        of the whole document. Containers are traversed, but not yielded.
+
+        Args:
+        ----
+            file: The file to parse.
+                Can be a file path (str or Path), or a file-like object.
+
+        Keyword Args:
+        ------------
+            ns (Optional[str]): The namespace of the KML file.
+                If not provided, it will be inferred from the root element.
+            name_spaces (Optional[Dict[str, str]]): Additional namespaces.
+            strict (bool): Whether to enforce strict parsing rules. Defaults to True.
+
+        Yields:
+        ------
+            The placemarks, ground overlays and photo overlays in document order.
+
+        """
+        feature_classes: Dict[
+            str,
+            Union[Type[Placemark], Type[GroundOverlay], Type[PhotoOverlay]],
+        ] = {}
+        parents: List[Element] = []
+        for event, element in _iterparse(file):
+            if event == "start":
+                if not parents:
+                    if ns is None:
+                        ns = element.tag[:-3] if element.tag.endswith("kml") else ""
+                    name_spaces = {**(name_spaces or {})}
+                    if ns:
+                        name_spaces["kml"] = ns
+                    name_spaces = {**config.NAME_SPACES, **name_spaces}
+                    feature_classes = {
+                        f"{ns}{feature_class.get_tag_name()}": feature_class
+                        for feature_class in (Placemark, GroundOverlay, PhotoOverlay)
+                    }
+                parents.append(element)
+                continue
+            parents.pop()
+            feature_class = feature_classes.get(element.tag)
+            if feature_class is None:
+                continue
+            yield feature_class.class_from_element(
+                ns=ns,
+                name_spaces=name_spaces,
+                element=element,
+                strict=strict,
+            )
+            if parents:
+                parents[-1].remove(element)
+
 
 registry.register(
     KML,
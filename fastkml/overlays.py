@@ -376,14 +376,12 @@ class ViewVolume(_XMLObject):
             bool: True if all the required attributes are not None, False otherwise.
 
         """
-        return all(
-            [
-                self.left_fov is not None,
-                self.right_fov is not None,
-                self.bottom_fov is not None,
-                self.top_fov is not None,
-                self.near is not None,
-            ],
+        return (
+            self.left_fov is not None
+            and self.right_fov is not None
+            and self.bottom_fov is not None
+            and self.top_fov is not None
+            and self.near is not None
         )
 
 
@@ -992,13 +990,11 @@ class LatLonBox(_XMLObject):
             bool: True if all attributes (north, south, east, west) are not None.
 
         """
-        return all(
-            [
-                self.north is not None,
-                self.south is not None,
-                self.east is not None,
-                self.west is not None,
-            ],
+        return (
+            self.north is not None
+            and self.south is not None
+            and self.east is not None
+            and self.west is not None
         )
 
 
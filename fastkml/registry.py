@@ -59,6 +59,13 @@ class GetKWArgs(Protocol):
 
 
 class SetElement(Protocol):
+    """
+    Write an attribute of an XML object into its element.
+
+    ``_XMLObject.populate_element`` calls a setter only for attributes that are
+    not ``None``, unless the verbosity is ``Verbosity.verbose``.
+    """
+
     def __call__(
         self,
         obj: "_XMLObject",
@@ -89,6 +96,7 @@ class Registry:
     """A registry of XML objects."""
 
     _registry: Dict[Type["_XMLObject"], List[RegistryItem]]
+    _resolved: Dict[Type["_XMLObject"], Tuple[RegistryItem, ...]]
 
     def __init__(
         self,
@@ -96,6 +104,7 @@ class Registry:
     ) -> None:
         """Initialize the registry."""
         self._registry = registry or {}
+        self._resolved = {}
 
     def __repr__(self) -> str:
         """Create a string (c)representation for Registry."""
@@ -108,14 +117,24 @@ class Registry:
         existing = self._registry.get(cls, [])
         existing.append(item)
         self._registry[cls] = existing
-
-    def get(self, cls: Type["_XMLObject"]) -> List[RegistryItem]:
-        """Get a class by name."""
-        parents = reversed(cls.__mro__[:-1])
-        items = []
-        for parent in parents:
+        self._resolved.clear()
+
+    def get(self, cls: Type["_XMLObject"]) -> Tuple[RegistryItem, ...]:
+        """
+        Get the registry items of a class, including the inherited ones.
+
+        The items are resolved along the MRO once per class and cached until
+        the next call to ``register``.
+        """
+        try:
+            return self._resolved[cls]
+        except KeyError:
+            pass
+        items: List[RegistryItem] = []
+        for parent in reversed(cls.__mro__[:-1]):
             items.extend(self._registry.get(parent, []))
-        return items
+        self._resolved[cls] = tuple(items)
+        return self._resolved[cls]
 
 
 registry = Registry()
@@ -183,7 +183,7 @@ class _ColorStyle(_BaseObject):
     https://developers.google.com/kml/documentation/kmlreference#colorstyle
     """
 
-    color: Optional[str] = None
+    color: Optional[str]
     # Color and opacity (alpha) values are expressed in hexadecimal notation.
     # The range of values for any one color is 0 to 255 (00 to ff).
     # For alpha, 00 is fully transparent and ff is fully opaque.
@@ -355,7 +355,7 @@ class HotSpot(_XMLObject):
             bool: True if both x and y are not None, False otherwise.
 
         """
-        return all((self.x is not None, self.y is not None))
+        return self.x is not None and self.y is not None
 
     @classmethod
     def get_tag_name(cls) -> str:
@@ -864,12 +864,10 @@ class LabelStyle(_ColorStyle):
                 scale, color, color_mode.
 
         """
-        return any(
-            (
-                self.scale is not None,
-                self.color is not None,
-                self.color_mode is not None,
-            ),
+        return (
+            self.scale is not None
+            or self.color is not None
+            or self.color_mode is not None
         )
 
 
@@ -1259,7 +1257,7 @@ class Pair(_BaseObject):
             bool: True if the StyleMap has both a key and a style, False otherwise.
 
         """
-        return all((self.key is not None, self.style is not None))
+        return self.key is not None and self.style is not None
 
 
 registry.register(
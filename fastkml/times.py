@@ -226,31 +226,28 @@ class TimeStamp(_TimePrimitive):
         """Return True if the timestamp is valid."""
         return bool(self.timestamp)
 
-    def etree_element(
+    def populate_element(
         self,
+        element: Element,
         precision: Optional[int] = None,
         verbosity: Verbosity = Verbosity.normal,
-    ) -> Element:
+    ) -> None:
         """
-        Create an ElementTree element representing the TimeStamp object.
+        Populate an ElementTree element with the TimeStamp object.
 
         Args:
         ----
+            element (Element): The element to populate.
             precision (Optional[int]): The precision of the timestamp.
             verbosity (Verbosity): The verbosity level of the element.
 
-        Returns:
-        -------
-            Element: The ElementTree element representing the TimeStamp object.
-
         """
-        element = super().etree_element(precision=precision, verbosity=verbosity)
+        super().populate_element(element, precision=precision, verbosity=verbosity)
         when = config.etree.SubElement(
             element,
             f"{self.ns}when",
         )
         when.text = str(self.timestamp)
-        return element
 
     @classmethod
     def _get_kwargs(
@@ -337,25 +334,23 @@ class TimeSpan(_TimePrimitive):
         """Return True if the begin or end date is valid."""
         return bool(self.begin) or bool(self.end)
 
-    def etree_element(
+    def populate_element(
         self,
+        element: Element,
         precision: Optional[int] = None,
         verbosity: Verbosity = Verbosity.normal,
-    ) -> Element:
+    ) -> None:
         """
-        Create an Element object representing the time interval.
+        Populate an Element object with the time interval.
 
         Args:
         ----
+            element (Element): The element to populate.
             precision (Optional[int]): The precision of the time values.
             verbosity (Verbosity): The verbosity level for the element.
 
-        Returns:
-        -------
-            Element: The created Element object.
-
         """
-        element = super().etree_element(precision=precision, verbosity=verbosity)
+        super().populate_element(element, precision=precision, verbosity=verbosity)
         if self.begin is not None:  # noqa: SIM102
             if text := str(self.begin):
                 begin = config.etree.SubElement(
@@ -370,7 +365,6 @@ class TimeSpan(_TimePrimitive):
                     f"{self.ns}end",
                 )
                 end.text = text
-        return element
 
     @classmethod
     def _get_kwargs(
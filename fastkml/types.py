@@ -44,6 +44,12 @@ class Element(Protocol):
     tag: str
     text: str
 
+    def __len__(self) -> int:
+        """Return the number of child elements."""
+
+    def keys(self) -> Iterable[str]:
+        """Return the names of the attributes."""
+
     def set(self, tag: str, value: str) -> None:
         """Set the value of the tag."""
 
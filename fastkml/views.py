@@ -572,13 +572,11 @@ class LatLonAltBox(_XMLObject):
             bool: True if all attributes are not None, False otherwise.
 
         """
-        return all(
-            (
-                self.north is not None,
-                self.south is not None,
-                self.east is not None,
-                self.west is not None,
-            ),
+        return (
+            self.north is not None
+            and self.south is not None
+            and self.east is not None
+            and self.west is not None
         )
 
 
@@ -15,9 +15,10 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 
 """Test the base classes."""
-
+import sys
 
 from fastkml import base
+from fastkml import config
 from fastkml import kml_base
 from tests.base import Lxml
 from tests.base import StdLibrary
@@ -59,6 +60,24 @@ class TestStdLibrary(StdLibrary):
 
         assert obj._get_splat() == {"custom": "custom", "altkw": 2}
 
+    def test_populate_element(self) -> None:
+        obj = kml_base._BaseObject(id="id-0", target_id="target-id-0")
+        parent = config.etree.Element("parent")
+        element = config.etree.SubElement(parent, "child")
+
+        obj.populate_element(element)
+
+        assert element.get("id") == "id-0"
+        assert element.get("targetId") == "target-id-0"
+        assert list(parent) == [element]
+
+    def test_ns_interned(self) -> None:
+        # Build the namespace at runtime so it is not an interned literal.
+        ns = "".join(["{http://www.opengis.net/kml/2.2", "}"])  # noqa: FLY002
+        obj = kml_base._BaseObject(ns=ns)
+
+        assert obj.ns is sys.intern("{http://www.opengis.net/kml/2.2}")
+
     def test_eq(self) -> None:
         obj1 = kml_base._BaseObject(id="id-0", target_id="target-id-0")
         obj2 = kml_base._BaseObject(id="id-0", target_id="target-id-0")
@@ -116,6 +135,16 @@ class TestStdLibrary(StdLibrary):
         assert be.target_id == "td-00"
         assert be.ns == "{http://www.opengis.net/kml/2.2}"
 
+    def test_base_class_from_element(self) -> None:
+        element = config.etree.fromstring(
+            '<kml:test xmlns:kml="http://www.opengis.net/kml/2.2" id="id-0" />',
+        )
+
+        be = kml_base._BaseObject.class_from_element(element=element)
+
+        assert be.id == "id-0"
+        assert be.ns == "{http://www.opengis.net/kml/2.2}"
+
     def test_base_class_from_empty_string(self) -> None:
         be = kml_base._BaseObject.from_string("<test/>")
 
@@ -36,6 +36,14 @@ def test_set_etree_implementation_xml() -> None:
     assert config.etree.__name__ == "xml.etree.ElementTree"
 
 
+def test_set_etree_implementation_xml_c_accelerated() -> None:
+    c_etree = pytest.importorskip("_elementtree")
+    config.set_etree_implementation(ET)
+
+    assert config.etree.Element is c_etree.Element
+    assert config.etree.XMLParser is c_etree.XMLParser
+
+
 @pytest.mark.skipif(not LXML, reason="lxml not installed")
 def test_set_etree_implementation_lxml() -> None:
     config.set_etree_implementation(lxml.etree)
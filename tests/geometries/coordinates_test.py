@@ -64,6 +64,16 @@ class TestCoordinates(StdLibrary):
             (-123.940449937288, 49.16927524669021, 17.0),
         ]
 
+    def test_coordinates_from_string_mixed_dimensions(self) -> None:
+        """Test the from_string method with tuples of different dimensions."""
+        coordinates = Coordinates.from_string(
+            '<kml:coordinates xmlns:kml="http://www.opengis.net/kml/2.2">'
+            "0,0 1,0,10 1,1,20,5"
+            "</kml:coordinates>",
+        )
+
+        assert coordinates.coords == [(0, 0), (1, 0, 10), (1, 1, 20, 5)]
+
 
 class TestCoordinatesLxml(Lxml, TestCoordinates):
     pass
@@ -308,12 +308,14 @@ class TestGeometry(StdLibrary):
         """Test the to_string method."""
         g = _Geometry()
 
-        assert "http://www.opengis.net/kml/2.2" in g.to_string()
-        assert "targetId=" not in g.to_string()
-        assert "id=" not in g.to_string()
-        assert "extrude" not in g.to_string()
-        assert "altitudeMode" not in g.to_string()
-        assert "tessellate" not in g.to_string()
+        xml = g.to_string()
+
+        assert "http://www.opengis.net/kml/2.2" in xml
+        assert "targetId=" not in xml
+        assert "id=" not in xml
+        assert "extrude" not in xml
+        assert "altitudeMode" not in xml
+        assert "tessellate" not in xml
 
     def test_to_string_with_args(self) -> None:
         """Test the to_string method."""
@@ -326,12 +328,14 @@ class TestGeometry(StdLibrary):
             tessellate=True,
         )
 
-        assert "http://www.opengis.net/kml/2.3" in g.to_string()
-        assert 'targetId="target_id"' in g.to_string()
-        assert 'id="my-id"' in g.to_string()
-        assert "extrude" not in g.to_string()
-        assert "altitudeMode>relativeToGround<" in g.to_string()
-        assert "tessellate" not in g.to_string()
+        xml = g.to_string()
+
+        assert "http://www.opengis.net/kml/2.3" in xml
+        assert 'targetId="target_id"' in xml
+        assert 'id="my-id"' in xml
+        assert "extrude" not in xml
+        assert "altitudeMode>relativeToGround<" in xml
+        assert "tessellate" not in xml
 
     def test_to_string_terse_default(self) -> None:
         """Test that with terse verbosity, only the necessary elements are included."""
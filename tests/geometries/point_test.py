@@ -75,8 +75,10 @@ class TestPoint(StdLibrary):
 
         point = Point(geometry=p, extrude=False)
 
-        assert "coordinates>" in point.to_string(verbosity=Verbosity.terse)
-        assert "extrude" not in point.to_string(verbosity=Verbosity.terse)
+        xml = point.to_string(verbosity=Verbosity.terse)
+
+        assert "coordinates>" in xml
+        assert "extrude" not in xml
 
     def test_to_string_terse_non_default(self) -> None:
         """Test the to_string method, include extrude when true in terse mode."""
@@ -84,8 +86,10 @@ class TestPoint(StdLibrary):
 
         point = Point(geometry=p, extrude=True)
 
-        assert "coordinates>" in point.to_string(verbosity=Verbosity.terse)
-        assert "extrude>1</" in point.to_string(verbosity=Verbosity.terse)
+        xml = point.to_string(verbosity=Verbosity.terse)
+
+        assert "coordinates>" in xml
+        assert "extrude>1</" in xml
 
     def test_to_string_verbose_default(self) -> None:
         """Test the to_string method, include default for extrude in verbose mode."""
@@ -93,8 +97,10 @@ class TestPoint(StdLibrary):
 
         point = Point(geometry=p, extrude=False)
 
-        assert "coordinates>" in point.to_string(verbosity=Verbosity.verbose)
-        assert "extrude>0</" in point.to_string(verbosity=Verbosity.verbose)
+        xml = point.to_string(verbosity=Verbosity.verbose)
+
+        assert "coordinates>" in xml
+        assert "extrude>0</" in xml
 
     def test_to_string_verbose_non_default(self) -> None:
         """Test the to_string method, include extrude when true in verbose mode."""
@@ -102,8 +108,10 @@ class TestPoint(StdLibrary):
 
         point = Point(geometry=p, extrude=True)
 
-        assert "coordinates>" in point.to_string(verbosity=Verbosity.verbose)
-        assert "extrude>1</" in point.to_string(verbosity=Verbosity.verbose)
+        xml = point.to_string(verbosity=Verbosity.verbose)
+
+        assert "coordinates>" in xml
+        assert "extrude>1</" in xml
 
     def test_to_string_verbose_none(self) -> None:
         """Test the to_string method, include extrude when true in verbose mode."""
@@ -111,8 +119,10 @@ class TestPoint(StdLibrary):
 
         point = Point(geometry=p, extrude=False)
 
-        assert "coordinates>" in point.to_string(verbosity=Verbosity.verbose)
-        assert "extrude>0</" in point.to_string(verbosity=Verbosity.verbose)
+        xml = point.to_string(verbosity=Verbosity.verbose)
+
+        assert "coordinates>" in xml
+        assert "extrude>0</" in xml
 
     def test_to_string_2d_precision_0(self) -> None:
         """Test the to_string method."""
@@ -202,6 +202,38 @@ class TestTrack(StdLibrary):
         assert "angles>" in track.to_string()
         assert ">0.0 0.0 0.0</" in track.to_string()
 
+    def test_track_etree_element_name_spaces(self) -> None:
+        time1 = datetime.datetime(2023, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
+        track_items = [TrackItem(when=time1, coord=geo.Point(1, 2), angle=Angle())]
+        track = Track(ns="", track_items=track_items)
+
+        element = track.etree_element(
+            name_spaces={"kml": "{urn:kml}", "gx": "{urn:gx}"},
+        )
+
+        assert [child.tag for child in element.findall("*")] == [
+            "{urn:kml}when",
+            "{urn:gx}coord",
+            "{urn:gx}angles",
+        ]
+
+    def test_track_custom_name_spaces_track_items(self) -> None:
+        time1 = datetime.datetime(2023, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
+        track_items = [TrackItem(when=time1, coord=geo.Point(1, 2), angle=Angle())]
+        track = Track(
+            ns="",
+            name_spaces={"kml": "{urn:kml}", "gx": "{urn:gx}"},
+            track_items=track_items,
+        )
+
+        element = track.etree_element()
+
+        assert [child.tag for child in element.findall("*")] == [
+            "{http://www.opengis.net/kml/2.2}when",
+            "{http://www.google.com/kml/ext/2.2}coord",
+            "{http://www.google.com/kml/ext/2.2}angles",
+        ]
+
     def test_track_from_track_items_and_geometry(self) -> None:
         ls = geo.LineString(((1, 2), (2, 0)))
         time1 = datetime.datetime(2023, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
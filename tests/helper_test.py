@@ -19,11 +19,21 @@ from typing import Callable
 from unittest.mock import Mock
 from unittest.mock import patch
 
+import pytest
+
+from fastkml import config
+from fastkml import helpers
+from fastkml.enums import AltitudeMode
+from fastkml.enums import Verbosity
+from fastkml.helpers import _get_enum_value
 from fastkml.helpers import attribute_enum_kwarg
 from fastkml.helpers import attribute_float_kwarg
+from fastkml.helpers import get_value
 from fastkml.helpers import subelement_enum_kwarg
 from fastkml.helpers import subelement_float_kwarg
 from fastkml.helpers import subelement_int_kwarg
+from fastkml.helpers import xml_subelement_list_kwarg
+from tests.base import Lxml
 from tests.base import StdLibrary
 
 
@@ -41,7 +51,7 @@ class TestStdLibrary(StdLibrary):
     def test_subelement_int_kwarg(self) -> None:
         node = Node()
         node.text = ""
-        element = Mock()
+        element = Mock(spec=["find"])
         element.find.return_value = node
         res = subelement_int_kwarg(
             element=element,
@@ -57,7 +67,7 @@ class TestStdLibrary(StdLibrary):
     def test_subelement_float_kwarg(self) -> None:
         node = Node()
         node.text = ""
-        element = Mock()
+        element = Mock(spec=["find"])
         element.find.return_value = node
         res = subelement_float_kwarg(
             element=element,
@@ -94,7 +104,7 @@ class TestStdLibrary(StdLibrary):
     def test_subelement_enum_kwarg(self) -> None:
         node = Node()
         node.text = ""
-        element = Mock()
+        element = Mock(spec=["find"])
         element.find.return_value = node
 
         res = subelement_enum_kwarg(
@@ -110,6 +120,24 @@ class TestStdLibrary(StdLibrary):
         assert res == {}
         element.find.assert_called_once_with("nsnode")
 
+    def test_get_enum_value_cached_exact_match_only(self) -> None:
+        with patch.dict(helpers._enum_values, clear=True):
+            assert (
+                _get_enum_value(enum_class=AltitudeMode, text="absolute", strict=True)
+                == AltitudeMode.absolute
+            )
+            assert (
+                helpers._enum_values[(AltitudeMode, "absolute")]
+                is AltitudeMode.absolute
+            )
+            assert (
+                _get_enum_value(enum_class=AltitudeMode, text="ABSOLUTE", strict=False)
+                == AltitudeMode.absolute
+            )
+            assert (AltitudeMode, "ABSOLUTE") not in helpers._enum_values
+            with pytest.raises(ValueError, match="ABSOLUTE"):
+                _get_enum_value(enum_class=AltitudeMode, text="ABSOLUTE", strict=True)
+
     def test_attribute_enum_kwarg(self) -> None:
         element = Mock()
         element.get.return_value = None
@@ -126,3 +154,48 @@ class TestStdLibrary(StdLibrary):
 
         assert res == {}
         element.get.assert_called_once_with("nsnode")
+
+    def test_get_value_normal(self) -> None:
+        obj = Mock(a=None, b=1)
+
+        assert (
+            get_value(obj, attr_name="a", verbosity=Verbosity.normal, default=1) is None
+        )
+        assert get_value(obj, attr_name="b", verbosity=Verbosity.normal, default=1) == 1
+
+    def test_get_value_verbose(self) -> None:
+        obj = Mock(a=None, b=2)
+
+        assert (
+            get_value(obj, attr_name="a", verbosity=Verbosity.verbose, default=1) == 1
+        )
+        assert (
+            get_value(obj, attr_name="b", verbosity=Verbosity.verbose, default=1) == 2
+        )
+
+    def test_get_value_terse(self) -> None:
+        obj = Mock(a=1, b=2)
+
+        assert (
+            get_value(obj, attr_name="a", verbosity=Verbosity.terse, default=1) is None
+        )
+        assert get_value(obj, attr_name="b", verbosity=Verbosity.terse, default=1) == 2
+
+    def test_xml_subelement_list_kwarg_no_classes(self) -> None:
+        element = config.etree.fromstring("<r><a/></r>")
+
+        res = xml_subelement_list_kwarg(
+            element=element,
+            ns="",
+            name_spaces={},
+            node_name="a",
+            kwarg="kwarg",
+            classes=(),
+            strict=False,
+        )
+
+        assert res == {"kwarg": []}
+
+
+class TestLxml(Lxml, TestStdLibrary):
+    """Test with lxml."""
@@ -23,6 +23,7 @@ import pygeoif as geo
 from fastkml import containers
 from fastkml import features
 from fastkml import kml
+from fastkml import overlays
 from fastkml.containers import Document
 from fastkml.features import Placemark
 from tests.base import Lxml
@@ -173,6 +174,66 @@ class TestParseKML(StdLibrary):
             ],
         )
 
+    def test_iter_features(self) -> None:
+        empty_placemark = KMLFILEDIR / "emptyPlacemarkWithoutId.xml"
+
+        placemarks = list(kml.KML.iter_features(empty_placemark))
+
+        assert placemarks == [Placemark(ns="{http://www.opengis.net/kml/2.2}")]
+
+    def test_iter_features_nested(self) -> None:
+        doc = io.BytesIO(
+            b'<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+            b"<Placemark><name>p0</name></Placemark>"
+            b"<Folder><GroundOverlay><name>g0</name></GroundOverlay>"
+            b"<Folder><Placemark><name>p1</name></Placemark></Folder></Folder>"
+            b"<PhotoOverlay><name>o0</name></PhotoOverlay>"
+            b"</Document></kml>",
+        )
+
+        feats = list(kml.KML.iter_features(doc))
+
+        assert [type(f) for f in feats] == [
+            Placemark,
+            overlays.GroundOverlay,
+            Placemark,
+            overlays.PhotoOverlay,
+        ]
+        assert [f.name for f in feats] == ["p0", "g0", "p1", "o0"]
+
+    def test_iter_features_does_not_modify_name_spaces(self) -> None:
+        empty_placemark = KMLFILEDIR / "emptyPlacemarkWithoutId.xml"
+        name_spaces = {"foo": "{urn:foo}"}
+
+        list(kml.KML.iter_features(empty_placemark, name_spaces=name_spaces))
+
+        assert name_spaces == {"foo": "{urn:foo}"}
+
+    def test_iter_features_multi_geometry(self) -> None:
+        doc = io.BytesIO(
+            b'<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+            b"<Placemark><MultiGeometry>"
+            b"<Point><coordinates>0,1</coordinates></Point>"
+            b"<LineString><coordinates>0,0 1,1</coordinates></LineString>"
+            b"<Polygon><outerBoundaryIs><LinearRing>"
+            b"<coordinates>3,0 4,0 4,1 3,0</coordinates>"
+            b"</LinearRing></outerBoundaryIs></Polygon>"
+            b"</MultiGeometry></Placemark>"
+            b"<Placemark><MultiGeometry>"
+            b"<Point><coordinates>0,1</coordinates></Point>"
+            b"<Point><coordinates>1,2</coordinates></Point>"
+            b"</MultiGeometry></Placemark>"
+            b"</Document></kml>",
+        )
+
+        geometries = [
+            p.geometry for p in kml.KML.iter_features(doc) if isinstance(p, Placemark)
+        ]
+
+        assert [len(g) for g in geometries] == [3, 2]  # type: ignore[arg-type]
+        assert isinstance(geometries[0], geo.GeometryCollection)
+        assert isinstance(geometries[1], geo.MultiPoint)
+
 
 class TestParseKMLNone(StdLibrary):
     def test_kml_parse(self) -> None:
@@ -183,10 +244,64 @@ class TestParseKMLNone(StdLibrary):
         assert doc.ns == "None"
 
 
+class TestWriteKML(StdLibrary):
+    def test_write_kml(self) -> None:
+        doc = kml.KML.parse(KMLFILEDIR / "emptyPlacemarkWithoutId.xml")
+        doc.append(Placemark(ns="{http://www.opengis.net/kml/2.2}", name="second"))
+        f = io.BytesIO()
+
+        doc.write(f)
+
+        assert f.getvalue().startswith(b"<?xml version=")
+        f.seek(0)
+        assert kml.KML.parse(f) == doc
+
+    def test_write_kml_no_ns(self) -> None:
+        doc = kml.KML(ns="", features=[Placemark(ns="", name="no ns")])
+        f = io.BytesIO()
+
+        doc.write(f, prettyprint=False)
+
+        assert f.getvalue().endswith(doc.to_string(prettyprint=False).encode())
+
+
 class TestLxml(Lxml, TestStdLibrary):
     """Test with lxml."""
 
 
+class TestLxmlWriteKML(Lxml, TestWriteKML):
+    """Test writing with lxml."""
+
+    def test_write_kml_same_as_to_string(self) -> None:
+        ns = "{http://www.opengis.net/kml/2.2}"
+        doc = kml.KML(
+            ns=ns,
+            features=[
+                Placemark(ns=ns, name="first"),
+                Document(ns=ns, features=[Placemark(ns=ns, name="nested")]),
+            ],
+        )
+
+        for prettyprint in (True, False):
+            f = io.BytesIO()
+            doc.write(f, prettyprint=prettyprint)
+
+            assert f.getvalue() == (
+                b"<?xml version='1.0' encoding='UTF-8'?>\n"
+                + doc.to_string(prettyprint=prettyprint).encode()
+            )
+
+    def test_write_kml_without_features(self) -> None:
+        doc = kml.KML(ns="{http://www.opengis.net/kml/2.2}")
+        f = io.BytesIO()
+
+        doc.write(f)
+
+        assert f.getvalue() == (
+            b"<?xml version='1.0' encoding='UTF-8'?>\n" + doc.to_string().encode()
+        )
+
+
 class TestLxmlParseKML(Lxml, TestParseKML):
     """Test with Lxml."""
 
@@ -201,3 +316,32 @@ class TestLxmlParseKML(Lxml, TestParseKML):
         k = kml.KML.parse(doc, ns="{http://www.opengis.net/kml/2.2}")
         assert len(k.features) == 1
         assert isinstance(k.features[0], features.Placemark)
+
+    def test_iter_features_with_unbound_prefix(self) -> None:
+        doc = io.BytesIO(
+            b'<kml xmlns="http://www.opengis.net/kml/2.2">'
+            b"<Placemark><ExtendedData>"
+            b"<lc:attachment>image.png</lc:attachment>"
+            b"</ExtendedData>"
+            b"</Placemark> </kml>",
+        )
+
+        feats = list(
+            kml.KML.iter_features(doc, ns="{http://www.opengis.net/kml/2.2}"),
+        )
+
+        assert len(feats) == 1
+        assert isinstance(feats[0], features.Placemark)
+
+    def test_iter_features_text_stream(self) -> None:
+        doc = io.StringIO(
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+            "<Placemark><name>p\u00e9</name></Placemark>"
+            "<Folder><Placemark><name>p1</name></Placemark></Folder>"
+            "</Document></kml>",
+        )
+
+        feats = list(kml.KML.iter_features(doc))
+
+        assert [f.name for f in feats] == ["p\u00e9", "p1"]
@@ -204,6 +204,12 @@ class TestGroundOverlayString(StdLibrary):
 
         assert g.to_string() == expected.to_string()
 
+    def test_latlonbox_bool_zero(self) -> None:
+        llb = overlays.LatLonBox(north=0, south=0, east=0, west=0)
+
+        assert bool(llb)
+        assert not overlays.LatLonBox(north=0, south=0, east=0)
+
 
 class TestPhotoOverlay(StdLibrary):
     def test_create_photo_overlay_with_all_optional_parameters(self) -> None:
@@ -362,6 +368,21 @@ class TestPhotoOverlay(StdLibrary):
         assert po.view.roll == 60
         assert po.view.altitude_mode == AltitudeMode("relativeToGround")
 
+    def test_empty_children_not_serialized(self) -> None:
+        po = overlays.PhotoOverlay(
+            ns="",
+            name="empty children",
+            view_volume=overlays.ViewVolume(ns="", left_fov=10),
+            image_pyramid=overlays.ImagePyramid(ns=""),
+        )
+
+        xml = po.to_string()
+
+        assert "<name>empty children</name>" in xml
+        assert "ViewVolume" not in xml
+        assert "ImagePyramid" not in xml
+        assert "Point" not in xml
+
 
 class TestGroundOverlayLxml(Lxml, TestGroundOverlay):
     """Test with lxml."""
@@ -21,7 +21,9 @@ from typing import Optional
 from typing import Tuple
 from typing import Type
 from typing import Union
+from unittest.mock import Mock
 
+import fastkml
 from fastkml.base import _XMLObject
 from fastkml.enums import Verbosity
 from fastkml.registry import Registry
@@ -271,3 +273,82 @@ def test_registry_repr() -> None:
     registry = Registry()
 
     assert repr(registry) == "fastkml.registry.Registry({})"
+
+
+def test_registry_get_cached() -> None:
+    """Test that the resolved items are cached until a new item is registered."""
+    registry = Registry()
+    registry.register(
+        A,
+        RegistryItem(
+            ns_ids=("kml",),
+            classes=(A,),
+            attr_name="a",
+            get_kwarg=get_kwarg,
+            set_element=set_element,
+            node_name="a",
+        ),
+    )
+
+    assert registry.get(B) is registry.get(B)
+    assert len(registry.get(B)) == 1
+
+    registry.register(
+        B,
+        RegistryItem(
+            ns_ids=("kml",),
+            classes=(B,),
+            attr_name="b",
+            get_kwarg=get_kwarg,
+            set_element=set_element,
+            node_name="b",
+        ),
+    )
+
+    assert len(registry.get(B)) == 2
+    assert registry.get(B)[1].attr_name == "b"
+
+
+def test_registry_no_duplicate_attributes() -> None:
+    """Test that no attribute is parsed or serialized twice for a class."""
+    for cls in list(fastkml.registry.registry._registry):
+        attr_names = [item.attr_name for item in fastkml.registry.registry.get(cls)]
+
+        assert len(attr_names) == len(set(attr_names)), cls
+
+
+def test_populate_element_skips_unset_attributes() -> None:
+    """Test that setters are called for unset attributes only when verbose."""
+
+    class Unset(_XMLObject):
+        """A test class with an optional attribute."""
+
+        value: Optional[str] = None
+
+    setter = Mock()
+    fastkml.registry.registry.register(
+        Unset,
+        RegistryItem(
+            ns_ids=("kml",),
+            classes=(str,),
+            attr_name="value",
+            get_kwarg=get_kwarg,
+            set_element=setter,
+            node_name="value",
+        ),
+    )
+    obj = Unset()
+
+    obj.etree_element(verbosity=Verbosity.normal)
+    obj.etree_element(verbosity=Verbosity.terse)
+
+    setter.assert_not_called()
+
+    obj.etree_element(verbosity=Verbosity.verbose)
+
+    assert setter.call_count == 1
+
+    obj.value = "set"
+    obj.etree_element(verbosity=Verbosity.normal)
+
+    assert setter.call_count == 2